@@ -3,6 +3,43 @@ VIDEO_EXTENSIONS = {".mkv", ".mp4"}  # used when burning subtitles
 PCM_CODEC = "pcm_s16le"  # 16-bit PCM
 AUDIO_CHANNELS = 1  # mono
 AUDIO_SAMPLE_RATE = 16_000  # 16 kHz
+BATCH_SIZE = 16  # audio chunks per batched Whisper forward pass
+PIPELINE_QUEUE_SIZE = 2  # files buffered between decode/transcribe/burn stages
+SHM_MIN_FREE_BYTES = 1 << 30  # /dev/shm space needed for .wav files (~9h of audio)
+WHISPER_CPP_BINARY = "whisper-cli"  # whisper.cpp CLI used by the whisper_cpp backend
+DEFAULT_SERVER_ADDRESS = "127.0.0.1:50007"  # `serve` daemon listen address
+
+# Silero VAD pre-filtering (windows are capped at Whisper's 30s chunk length)
+VAD_PARAMETERS = {
+    "min_silence_duration_ms": 160,  # split speech on pauses this long
+    "speech_pad_ms": 500,  # keep 0.5s of context around each region so words are not clipped
+}
+
+# Decoding guards (Whisper's defaults): drop repetitive or likely-silent segments
+COMPRESSION_RATIO_THRESHOLD = 2.4
+LOG_PROB_THRESHOLD = -1.0
+NO_SPEECH_THRESHOLD = 0.6
+
+# Stock phrases Whisper hallucinates from its YouTube training data (lowercase)
+BOILERPLATE_PHRASES = {
+    "thanks for watching",
+    "thank you for watching",
+    "thanks for watching and see you next time",
+    "please subscribe",
+    "subscribe to my channel",
+    "don't forget to like and subscribe",
+    "please like and subscribe",
+    "subtitles by the amara.org community",
+}
+
+# Burn-in video encoders as (codec, preset); NVENC is preferred when it works
+NVENC_ENCODER = ("h264_nvenc", "p4")
+SOFTWARE_ENCODER = ("libx264", "veryfast")
+FFMPEG_THREADS = 4  # cores a single burn-in ffmpeg typically keeps busy
+NVENC_MAX_SESSIONS = 2  # concurrent NVENC encodes allowed on consumer GPUs
+# Source audio codecs stream-copied into the .mp4; anything else is re-encoded
+MP4_COPY_AUDIO_CODECS = {"aac", "mp3", "ac3", "opus", "alac"}
+FALLBACK_AUDIO_CODEC = "aac"
 
 # Subtitle styling
 OUTLINE_COLOUR_HEX = "&H40000000"
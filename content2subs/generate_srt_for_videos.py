@@ -14,56 +14,219 @@ poetry env use 3.10
 
 # poetry install
 Script that scans a directory for supported media files (video/audio),
-uses OpenAI Whisper to generate .srt subtitles, and optionally burns them
+uses Whisper (via faster-whisper) to generate .srt subtitles, and optionally burns them
 onto a new .mp4 for video files.
 
 Usage (example):
-    python subtitle_generator.py \
+    python -m content2subs.generate_srt_for_videos \
         --root /path/to/videos \
         --model small \
         --srt_only true
 """
 
 import argparse
+import ipaddress
+import json
 import logging
+import multiprocessing
+import os
+import queue
+import secrets
+import shutil
+import subprocess
 import tempfile
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from multiprocessing.managers import BaseManager
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
-from constants import AUDIO_CHANNELS, AUDIO_SAMPLE_RATE, BORDER_STYLE, OUTLINE_COLOUR_HEX, PCM_CODEC, SUPPORTED_EXTENSIONS
+from content2subs.constants import (
+    AUDIO_CHANNELS,
+    AUDIO_SAMPLE_RATE,
+    BATCH_SIZE,
+    BORDER_STYLE,
+    COMPRESSION_RATIO_THRESHOLD,
+    DEFAULT_SERVER_ADDRESS,
+    FALLBACK_AUDIO_CODEC,
+    FFMPEG_THREADS,
+    LOG_PROB_THRESHOLD,
+    MP4_COPY_AUDIO_CODECS,
+    NO_SPEECH_THRESHOLD,
+    NVENC_ENCODER,
+    NVENC_MAX_SESSIONS,
+    OUTLINE_COLOUR_HEX,
+    PCM_CODEC,
+    PIPELINE_QUEUE_SIZE,
+    SHM_MIN_FREE_BYTES,
+    SOFTWARE_ENCODER,
+    SUPPORTED_EXTENSIONS,
+    VAD_PARAMETERS,
+    WHISPER_CPP_BINARY,
+)
+import ctranslate2
 import ffmpeg
-from utils import is_video_file, strip_extension, write_srt
-import whisper
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from content2subs.utils import is_video_file, write_srt
 from tqdm import tqdm
+from tqdm.contrib.concurrent import thread_map
 
-# Logging configuration
+# Logging configuration (applied only when run as a script)
 LOG_FORMAT = "%(asctime)s : %(message)s"
-logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
 
-def extract_audio(input_files: List[Path]) -> Dict[Path, Path]:
+def _run_ffmpeg(stream, stdout=subprocess.DEVNULL) -> bytes:
     """
-    For each file in `input_files`, uses ffmpeg to extract a mono 16kHz .wav file
-    to a temporary directory. Returns a dict mapping { original_path: extracted_wav_path }.
+    Run the ffmpeg-python `stream` at `-loglevel error`, so only failures reach
+    stderr instead of the whole encode log buffered by `.run(quiet=True)`.
+    Returns captured stdout when `stdout=subprocess.PIPE`.
+    Raises subprocess.CalledProcessError (with ffmpeg's stderr attached, and
+    logged) if ffmpeg fails.
     """
-    extracted_map = {}
-    for media_path in input_files:
-        base_stem = strip_extension(media_path)
-        wav_path = Path(tempfile.gettempdir()) / f"{base_stem}.wav"
-        logger.info("Extracting audio from '%s' to '%s'", media_path, wav_path)
-        (
-            ffmpeg.input(str(media_path))
-            .output(
+    cmd = stream.global_args("-hide_banner", "-loglevel", "error").compile(
+        overwrite_output=True
+    )
+    result = subprocess.run(
+        cmd, stdin=subprocess.DEVNULL, stdout=stdout, stderr=subprocess.PIPE
+    )
+    if result.returncode != 0:
+        stderr = result.stderr.decode(errors="replace").strip()
+        logger.error("ffmpeg exited with code %d: %s", result.returncode, stderr)
+        raise subprocess.CalledProcessError(
+            result.returncode, cmd, output=result.stdout, stderr=stderr
+        )
+    return result.stdout
+
+
+def _extract_one(media_path: Path) -> Tuple[Path, np.ndarray]:
+    """
+    Decode `media_path` to mono 16kHz PCM through an ffmpeg stdout pipe.
+    Returns (media_path, float32 samples in [-1, 1]).
+    """
+    logger.info("Extracting audio from '%s'", media_path)
+    pcm = _run_ffmpeg(
+        ffmpeg.input(str(media_path)).output(
+            "pipe:",
+            format="s16le",
+            acodec=PCM_CODEC,
+            ac=AUDIO_CHANNELS,
+            ar=str(AUDIO_SAMPLE_RATE),
+        ),
+        stdout=subprocess.PIPE,
+    )
+    # Scale in place: a second float32 copy would add ~230 MB per hour of audio
+    audio = np.frombuffer(pcm, np.int16).astype(np.float32)
+    del pcm
+    audio /= 32768.0
+    return media_path, audio
+
+
+def _temp_audio_dir() -> Path:
+    """
+    Create a private directory for extracted .wav files: on the /dev/shm tmpfs
+    when it is writable and has SHM_MIN_FREE_BYTES free (Linux), so the audio
+    never touches the disk; otherwise in the regular temporary directory (e.g.
+    %TEMP% on Windows, or when Docker's 64 MB /dev/shm would run out).
+    """
+    shm = Path("/dev/shm")
+    root = tempfile.gettempdir()
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        free = shutil.disk_usage(shm).free
+        if free >= SHM_MIN_FREE_BYTES:
+            root = str(shm)
+        else:
+            logger.info(
+                "Only %d MB free in %s; extracting audio to %s instead.",
+                free >> 20,
+                shm,
+                root,
+            )
+    return Path(tempfile.mkdtemp(prefix="content2subs-", dir=root))
+
+
+def _extract_wav(media_path: Path, tmp_root: Path) -> Tuple[Path, Path]:
+    """
+    Extract a mono 16kHz .wav from `media_path` into `tmp_root`, for backends
+    that read audio from disk. Returns (media_path, wav_path).
+    The .wav gets a unique name, since e.g. x.mp4 and x.mkv are extracted
+    concurrently into the same directory.
+    """
+    fd, wav_name = tempfile.mkstemp(
+        suffix=".wav", prefix=f"{media_path.stem}-", dir=tmp_root
+    )
+    os.close(fd)
+    wav_path = Path(wav_name)
+    logger.info("Extracting audio from '%s' to '%s'", media_path, wav_path)
+    try:
+        _run_ffmpeg(
+            ffmpeg.input(str(media_path)).output(
                 str(wav_path),
                 acodec=PCM_CODEC,
                 ac=AUDIO_CHANNELS,
                 ar=str(AUDIO_SAMPLE_RATE),
             )
-            .run(quiet=True, overwrite_output=True)
         )
-        extracted_map[media_path] = wav_path
-    return extracted_map
+    except BaseException:
+        wav_path.unlink(missing_ok=True)
+        raise
+    return media_path, wav_path
+
+
+@lru_cache(maxsize=None)
+def _video_encoder() -> Tuple[str, str]:
+    """
+    Return the (codec, preset) to burn subtitles with: NVENC when a tiny test
+    encode succeeds on this machine, libx264 otherwise. Probed once per process.
+    """
+    probe = ffmpeg.input("color=size=256x256:duration=0.1", f="lavfi").output(
+        "-", f="null", vcodec=NVENC_ENCODER[0]
+    )
+    # Run directly rather than through _run_ffmpeg: failing here is expected
+    # on machines without NVENC and is not worth an error in the log
+    returncode = subprocess.run(
+        probe.compile(),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    ).returncode
+    if returncode != 0:
+        logger.info(
+            "NVENC unavailable; burning subtitles with %s.", SOFTWARE_ENCODER[0]
+        )
+        return SOFTWARE_ENCODER
+    return NVENC_ENCODER
+
+
+def _burn_workers() -> int:
+    """
+    Number of burn-in ffmpeg processes to run at once: enough to fill the CPU
+    at FFMPEG_THREADS cores each, capped at NVENC_MAX_SESSIONS when encoding on
+    the GPU (consumer cards limit concurrent NVENC sessions).
+    """
+    workers = max(1, (os.cpu_count() or 1) // FFMPEG_THREADS)
+    if _video_encoder() == NVENC_ENCODER:
+        workers = min(workers, NVENC_MAX_SESSIONS)
+    return workers
+
+
+def _audio_codec(video_path: Path) -> str:
+    """
+    Return the ffmpeg codec to write `video_path`'s audio into an .mp4 with:
+    "copy" when its first audio stream is MP4-compatible (MP4_COPY_AUDIO_CODECS),
+    FALLBACK_AUDIO_CODEC otherwise (e.g. PCM or Vorbis from .mkv files), or
+    also when the stream cannot be probed.
+    """
+    try:
+        streams = ffmpeg.probe(str(video_path), select_streams="a:0")["streams"]
+    except (ffmpeg.Error, OSError):
+        logger.warning("Could not probe audio of '%s'; re-encoding it.", video_path)
+        return FALLBACK_AUDIO_CODEC
+    if streams and streams[0].get("codec_name") in MP4_COPY_AUDIO_CODECS:
+        return "copy"
+    return FALLBACK_AUDIO_CODEC
 
 
 def burn_subtitles_into_video(
@@ -72,82 +235,723 @@ def burn_subtitles_into_video(
     """
     Use ffmpeg to burn the given SRT file into `video_path`,
     saving a new .mp4 in `output_dir` named <stem>_subtitled.mp4.
+    Video is re-encoded on the GPU when possible; the first audio track (if
+    any) is copied as-is when the .mp4 container supports its codec, and
+    re-encoded to AAC otherwise.
     """
-    output_file = output_dir / f"{strip_extension(video_path)}_subtitled.mp4"
+    output_file = output_dir / f"{video_path.stem}_subtitled.mp4"
     logger.info("Burning subtitles for '%s' into '%s'", video_path, output_file)
 
     video_input = ffmpeg.input(str(video_path))
-    audio_input = video_input.audio
+    vcodec, preset = _video_encoder()
 
-    (
-        ffmpeg.concat(
-            video_input.filter(
+    _run_ffmpeg(
+        ffmpeg.output(
+            video_input.video.filter(
                 "subtitles",
                 str(srt_path),
                 force_style=f"OutlineColour={OUTLINE_COLOUR_HEX},BorderStyle={BORDER_STYLE}",
             ),
-            audio_input,
-            v=1,
-            a=1,
+            # Only the first audio track (the one _audio_codec probed), if any
+            video_input["a:0?"],
+            str(output_file),
+            vcodec=vcodec,
+            preset=preset,
+            acodec=_audio_codec(video_path),
         )
-        .output(str(output_file))
-        .run(quiet=True, overwrite_output=True)
     )
 
     return output_file
 
 
-def generate_subtitles(
-    media_paths: List[Path], model_name: str, srt_only: bool, output_dir: Path
-):
+@dataclass
+class WhisperCppModel:
     """
-    High-level function to:
-      1. Load the specified Whisper model.
-      2. Extract audio from each media file.
-      3. Transcribe the audio -> .srt (saved in `output_dir`).
-      4. Optionally burn the .srt into a new .mp4 for video files if `srt_only` is False.
+    A GGML Whisper model run through the whisper.cpp CLI, for CPU-only hosts.
     """
-    if not media_paths:
-        logger.info("No files to process.")
-        return
 
-    # 1) Load the Whisper model
-    logger.info("Loading Whisper model '%s'...", model_name)
+    model_path: Path
+    language: str = "auto"
+    threads: int = 1
+
+    def transcribe(self, wav_path: Path) -> List[dict]:
+        """
+        Transcribe the 16kHz `wav_path` and return its segments as
+        `{start, end, text}` dicts (seconds), like the faster-whisper path.
+        Raises subprocess.CalledProcessError (with stderr attached, and logged)
+        if whisper.cpp fails.
+        """
+        json_path = wav_path.with_suffix(".json")
+        cmd = [
+            WHISPER_CPP_BINARY,
+            "-m",
+            str(self.model_path),
+            "-f",
+            str(wav_path),
+            "-oj",
+            "-of",
+            str(json_path.with_suffix("")),
+            "-t",
+            str(self.threads),
+            "-l",
+            self.language,
+            "-np",
+        ]
+        # -np leaves only errors on stderr; keep them, as _run_ffmpeg does
+        result = subprocess.run(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        if result.returncode != 0:
+            stderr = result.stderr.decode(errors="replace").strip()
+            logger.error(
+                "%s exited with code %d: %s",
+                WHISPER_CPP_BINARY,
+                result.returncode,
+                stderr,
+            )
+            json_path.unlink(missing_ok=True)
+            raise subprocess.CalledProcessError(result.returncode, cmd, stderr=stderr)
+        try:
+            with json_path.open(encoding="utf-8", errors="replace") as f:
+                transcription = json.load(f)["transcription"]
+        finally:
+            json_path.unlink(missing_ok=True)
+        return [
+            {
+                "start": item["offsets"]["from"] / 1000,
+                "end": item["offsets"]["to"] / 1000,
+                "text": item["text"],
+            }
+            for item in transcription
+        ]
+
+
+@dataclass
+class _SubprocessState:
+    """
+    Keeps the loaded Whisper model resident so repeated jobs in the same
+    process skip the model load.
+    """
+
+    model_name: Optional[str] = None
+    compute_type: Optional[str] = None
+    backend: Optional[str] = None
+    model: Union[BatchedInferencePipeline, WhisperCppModel, None] = None
+
+    def get_model(
+        self,
+        model_name: str,
+        compute_type: str = "auto",
+        backend: str = "faster_whisper",
+    ) -> Union[BatchedInferencePipeline, WhisperCppModel]:
+        if (
+            self.model is None
+            or self.model_name != model_name
+            or self.compute_type != compute_type
+            or self.backend != backend
+        ):
+            self.model = load_model(model_name, compute_type, backend)
+            self.model_name = model_name
+            self.compute_type = compute_type
+            self.backend = backend
+        return self.model
+
+
+_STATE = _SubprocessState()
+
+
+def _model_cache_dir() -> str:
+    """Directory holding whisper.cpp GGML files: $WHISPER_CACHE or ~/.cache/whisper."""
+    return os.environ.get("WHISPER_CACHE", str(Path.home() / ".cache" / "whisper"))
+
+
+def _has_avx512() -> bool:
+    """
+    Return True if /proc/cpuinfo advertises AVX-512 (False where it does not exist).
+    """
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            return "avx512f" in f.read()
+    except OSError:
+        return False
+
+
+def _load_whisper_cpp_model(model_name: str) -> WhisperCppModel:
+    """
+    Resolve `model_name` (a GGML file path, or a name looked up as
+    ggml-<name>[-<quant>].bin under $WHISPER_CACHE) for the whisper.cpp backend.
+    Quantized files are preferred, among those whisper.cpp publishes (q5_1 for
+    tiny/base/small, q5_0 for medium/large, q8_0 for all): q8_0 on AVX-512
+    CPUs (int8 dot products), 5-bit elsewhere.
+    """
+    language = "en" if model_name.endswith(".en") else "auto"
+    threads = os.cpu_count() or 1
+    if Path(model_name).is_file():
+        return WhisperCppModel(Path(model_name), language, threads)
+
+    if _has_avx512():
+        quants = ["q8_0", "q5_1", "q5_0", "q4_0"]
+    else:
+        quants = ["q5_1", "q5_0", "q8_0", "q4_0"]
+    candidates = [f"ggml-{model_name}-{quant}.bin" for quant in quants]
+    candidates.append(f"ggml-{model_name}.bin")
+    model_dir = Path(_model_cache_dir())
+    for candidate in candidates:
+        model_path = model_dir / candidate
+        if model_path.is_file():
+            logger.info("Using whisper.cpp model '%s'", model_path)
+            return WhisperCppModel(model_path, language, threads)
+    raise FileNotFoundError(
+        f"No whisper.cpp model for '{model_name}' in '{model_dir}' "
+        f"(looked for {', '.join(candidates)})"
+    )
+
+
+def load_model(
+    model_name: str, compute_type: str = "auto", backend: str = "faster_whisper"
+) -> Union[BatchedInferencePipeline, WhisperCppModel]:
+    """
+    Load `model_name` with faster-whisper, on CUDA if available (replicated
+    across all GPUs when there are several), wrapped in a BatchedInferencePipeline.
+    With `backend="whisper_cpp"`, resolve a GGML model for whisper.cpp instead.
+
+    `compute_type` is a CTranslate2 quantization (e.g. "float16", "int8_float16",
+    "int8"); "auto" picks int8_float16 on GPU and int8 on CPU.
+
+    Checkpoints are cached under $WHISPER_CACHE if set (else the Hugging Face
+    cache) and only downloaded when missing there.
+    """
+    if backend == "whisper_cpp":
+        return _load_whisper_cpp_model(model_name)
+
+    logger.info("Loading Whisper model '%s' (faster-whisper)...", model_name)
     if model_name.endswith(".en"):
         logger.warning(
             "%s is an English-only model; forcing English detection.", model_name
         )
-    model = whisper.load_model(model_name)
+    n_gpu = ctranslate2.get_cuda_device_count()
+    device = "cuda" if n_gpu > 0 else "cpu"
+    if compute_type == "auto":
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+    # Only override the Hugging Face cache when explicitly asked to
+    download_root = os.environ.get("WHISPER_CACHE")
+    # One model replica per GPU (num_workers counts replicas *per device*);
+    # concurrent transcribe() calls run in parallel across the devices
+    model_kwargs = dict(
+        device=device,
+        device_index=list(range(n_gpu)) if n_gpu > 1 else 0,
+        compute_type=compute_type,
+        num_workers=1,
+        download_root=download_root,
+    )
+    try:
+        # Load a cached checkpoint without a round-trip to the Hugging Face Hub
+        model = WhisperModel(model_name, local_files_only=True, **model_kwargs)
+    except FileNotFoundError:
+        logger.info(
+            "Downloading Whisper model '%s' to '%s'...",
+            model_name,
+            download_root or "the Hugging Face cache",
+        )
+        model = WhisperModel(model_name, **model_kwargs)
+    # Batch the VAD-segmented chunks of each file through the encoder at once
+    return BatchedInferencePipeline(model=model)
+
+
+def _is_reliable(segment) -> bool:
+    """
+    Apply Whisper's compression-ratio and no-speech guards to a decoded segment.
+    The batched pipeline decodes each window once (no temperature fallback) and
+    only records these scores, so repetitive or silent windows are dropped here.
+    """
+    if segment.compression_ratio > COMPRESSION_RATIO_THRESHOLD:
+        return False
+    return not (
+        segment.no_speech_prob > NO_SPEECH_THRESHOLD
+        and segment.avg_logprob < LOG_PROB_THRESHOLD
+    )
+
+
+def _transcribe_one(
+    model: BatchedInferencePipeline,
+    media_path: Path,
+    audio: np.ndarray,
+    output_dir: Path,
+) -> Tuple[Path, Path]:
+    """
+    Transcribe the decoded `audio` of `media_path` and write `<stem>.srt` to `output_dir`.
+    Returns (media_path, srt_path).
+    """
+    srt_file = output_dir / f"{media_path.stem}.srt"
+    logger.info("Transcribing '%s' -> '%s'", media_path, srt_file)
+    # Silero VAD drops silence and packs speech into <=30s windows; each window
+    # is decoded independently so a bad one cannot derail the next
+    segments, _info = model.transcribe(
+        audio,
+        beam_size=5,
+        batch_size=BATCH_SIZE,
+        vad_filter=True,
+        vad_parameters=VAD_PARAMETERS,
+        condition_on_previous_text=False,
+        compression_ratio_threshold=COMPRESSION_RATIO_THRESHOLD,
+        log_prob_threshold=LOG_PROB_THRESHOLD,
+        no_speech_threshold=NO_SPEECH_THRESHOLD,
+    )
+    segments = [
+        {"start": seg.start, "end": seg.end, "text": seg.text}
+        for seg in segments
+        if _is_reliable(seg)
+    ]
+    write_srt(segments, srt_file)
+    return media_path, srt_file
+
+
+_DONE = object()  # end-of-stream marker passed between pipeline stages
+
+
+def _start_stage(
+    func: Callable,
+    inbox: queue.Queue,
+    outbox: Optional[queue.Queue],
+    workers: int,
+    errors: list,
+) -> threading.Thread:
+    """
+    Run `func` over the items of `inbox` on `workers` threads, putting non-None
+    results on `outbox`; a final `_DONE` is forwarded once every worker has
+    finished. Exceptions are logged and collected in `errors` so the rest of
+    the pipeline keeps draining. Returns the thread supervising the stage.
+    """
+
+    def work():
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                inbox.put(_DONE)  # let the sibling workers stop too
+                return
+            try:
+                result = func(item)
+            except Exception as exc:
+                logger.exception("Pipeline stage '%s' failed", func.__name__)
+                errors.append(exc)
+                continue
+            finally:
+                item = None  # don't pin the input (e.g. decoded audio) while blocked
+            if outbox is not None and result is not None:
+                outbox.put(result)
+
+    def supervise():
+        threads = [threading.Thread(target=work, daemon=True) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if outbox is not None:
+            outbox.put(_DONE)
+
+    supervisor = threading.Thread(target=supervise, daemon=True)
+    supervisor.start()
+    return supervisor
+
+
+def _subtitle_pipeline(
+    model: BatchedInferencePipeline,
+    media_paths: List[Path],
+    srt_only: bool,
+    output_dir: Path,
+    max_workers: Optional[int] = None,
+) -> Dict[Path, Path]:
+    """
+    Overlap the three stages across files instead of running them back to back:
+    ffmpeg decode -> transcription (one thread per GPU) -> burn-in (bounded by
+    `_burn_workers()`), so file k+1 is decoded while file k is transcribed.
+    A semaphore taken before each decode and released once that file is
+    transcribed caps the decoded arrays alive at PIPELINE_QUEUE_SIZE plus one
+    per transcription thread, however large `max_workers` is.
+    Returns a dict mapping { media_path: srt_path }.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    paths_q = queue.Queue()
+    for media_path in media_paths:
+        paths_q.put(media_path)
+    paths_q.put(_DONE)
+    audio_q = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    burn_q = None if srt_only else queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+
+    subtitles_map = {}
+    errors = []
+    progress = tqdm(total=len(media_paths), desc="Transcribing")
+
+    n_gpu = ctranslate2.get_cuda_device_count()
+    transcribe_workers = max(1, n_gpu)
+    max_decoded = PIPELINE_QUEUE_SIZE + transcribe_workers
+    decoded = threading.BoundedSemaphore(max_decoded)
+
+    def decode(media_path):
+        decoded.acquire()
+        try:
+            return _extract_one(media_path)
+        except BaseException:
+            decoded.release()
+            raise
+
+    def transcribe(item):
+        try:
+            media_path, srt_path = _transcribe_one(model, *item, output_dir)
+        finally:
+            decoded.release()
+        subtitles_map[media_path] = srt_path
+        progress.update(1)
+        if srt_only:
+            return None
+        if not is_video_file(media_path):
+            logger.info("Skipping burn-in for '%s' (audio-only).", media_path)
+            return None
+        return media_path, srt_path
+
+    def burn(item):
+        output_file = burn_subtitles_into_video(*item, output_dir)
+        logger.info("Saved subtitled video to '%s'", output_file)
+
+    stages = [
+        _start_stage(
+            decode,
+            paths_q,
+            audio_q,
+            max(1, min(len(media_paths), max_workers, max_decoded)),
+            errors,
+        ),
+        _start_stage(transcribe, audio_q, burn_q, transcribe_workers, errors),
+    ]
+    if burn_q is not None:
+        stages.append(
+            _start_stage(
+                burn, burn_q, None, max(1, min(_burn_workers(), max_workers)), errors
+            )
+        )
+    for stage in stages:
+        stage.join()
+    progress.close()
+
+    if errors:
+        raise errors[0]
+    return subtitles_map
 
-    # 2) Extract .wav audio from each file
-    audio_map = extract_audio(media_paths)
 
-    # 3) Transcribe + create SRT
+def _transcribe_with_whisper_cpp(
+    model: WhisperCppModel,
+    media_paths: List[Path],
+    output_dir: Path,
+    max_workers: Optional[int] = None,
+) -> Dict[Path, Path]:
+    """
+    Extract .wav files into `_temp_audio_dir()` and transcribe them one at a
+    time with whisper.cpp (each run already uses every CPU core). Each .wav is
+    deleted as soon as it is transcribed, and a semaphore taken before each
+    extraction caps the .wav files on disk at PIPELINE_QUEUE_SIZE + 1.
+    Returns a dict mapping { media_path: srt_path }.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    tmp_root = _temp_audio_dir()
+    paths_q = queue.Queue()
+    for media_path in media_paths:
+        paths_q.put(media_path)
+    paths_q.put(_DONE)
+    wav_q = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+
     subtitles_map = {}
-    for media_path, wav_path in audio_map.items():
-        stem = strip_extension(media_path)
-        srt_file = output_dir / f"{stem}.srt"
-
-        logger.info("Transcribing '%s' -> '%s'", media_path, srt_file)
-        result = model.transcribe(str(wav_path))
-        segments = result["segments"]
-        write_srt(segments, srt_file)
+    errors = []
+
+    max_wavs = PIPELINE_QUEUE_SIZE + 1
+    wavs = threading.BoundedSemaphore(max_wavs)
+
+    def extract(media_path):
+        wavs.acquire()
+        try:
+            return _extract_wav(media_path, tmp_root)
+        except BaseException:
+            wavs.release()
+            raise
+
+    def transcribe(item):
+        media_path, wav_path = item
+        srt_file = output_dir / f"{media_path.stem}.srt"
+        logger.info("Transcribing '%s' -> '%s' (whisper.cpp)", media_path, srt_file)
+        try:
+            write_srt(model.transcribe(wav_path), srt_file)
+        finally:
+            wav_path.unlink(missing_ok=True)
+            wavs.release()
         subtitles_map[media_path] = srt_file
 
-    # 4) If srt_only=False, burn subtitles into a new .mp4 for each video
-    if not srt_only:
-        for media_path, srt_path in subtitles_map.items():
-            if is_video_file(media_path):
-                output_file = burn_subtitles_into_video(
-                    media_path, srt_path, output_dir
-                )
-                logger.info("Saved subtitled video to '%s'", output_file)
-            else:
-                logger.info("Skipping burn-in for '%s' (audio-only).", media_path)
+    try:
+        stages = [
+            _start_stage(
+                extract,
+                paths_q,
+                wav_q,
+                max(1, min(len(media_paths), max_workers, max_wavs)),
+                errors,
+            ),
+            _start_stage(transcribe, wav_q, None, 1, errors),
+        ]
+        for stage in stages:
+            stage.join()
+    finally:
+        shutil.rmtree(tmp_root, ignore_errors=True)
+
+    if errors:
+        raise errors[0]
+    return subtitles_map
+
+
+def _burn_all(subtitles_map: Dict[Path, Path], output_dir: Path) -> None:
+    """
+    Burn each .srt in `subtitles_map` into its video, several videos at a time.
+    """
+    videos_to_burn = []
+    for media_path, srt_path in subtitles_map.items():
+        if is_video_file(media_path):
+            videos_to_burn.append((media_path, srt_path))
+        else:
+            logger.info("Skipping burn-in for '%s' (audio-only).", media_path)
+    if videos_to_burn:
+        output_files = thread_map(
+            lambda item: burn_subtitles_into_video(*item, output_dir),
+            videos_to_burn,
+            max_workers=_burn_workers(),
+            chunksize=1,
+            desc="Burning subtitles",
+        )
+        for output_file in output_files:
+            logger.info("Saved subtitled video to '%s'", output_file)
+
+
+def generate_subtitles(
+    media_paths: List[Path],
+    model: Union[BatchedInferencePipeline, WhisperCppModel],
+    srt_only: bool,
+    output_dir: Path,
+    max_workers: Optional[int] = None,
+):
+    """
+    High-level function to:
+      1. Extract audio from each media file (`max_workers` caps the ffmpeg
+         processes of each step; extraction is also bounded by the number of
+         decoded files the pipeline may hold, see `_subtitle_pipeline`).
+      2. Transcribe the audio with the pre-loaded `model` -> .srt (saved in `output_dir`).
+      3. Optionally burn the .srt into a new .mp4 for video files if `srt_only` is False.
+    With faster-whisper the three steps are pipelined across files.
+    """
+    if not media_paths:
+        logger.info("No files to process.")
+        return
+
+    if isinstance(model, WhisperCppModel):
+        # whisper.cpp already saturates the CPU, so burn-in runs afterwards
+        subtitles_map = _transcribe_with_whisper_cpp(
+            model, media_paths, output_dir, max_workers
+        )
+        if not srt_only:
+            _burn_all(subtitles_map, output_dir)
     else:
+        _subtitle_pipeline(model, media_paths, srt_only, output_dir, max_workers)
+
+    if srt_only:
         logger.info("SRT files generated only (no burn-in).")
 
 
+class _JobManager(BaseManager):
+    """
+    Exposes the daemon's job queue to client invocations over a socket.
+    """
+
+
+def _parse_address(address: str) -> Tuple[str, int]:
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _authkey_file() -> Path:
+    config_home = os.environ.get("XDG_CONFIG_HOME", str(Path.home() / ".config"))
+    return Path(config_home) / "content2subs" / "authkey"
+
+
+def _create_authkey() -> bytes:
+    """
+    Return $CONTENT2SUBS_AUTHKEY if set; otherwise generate a random key and
+    store it in `_authkey_file()` (mode 0600) for `submit_jobs` to read.
+    """
+    env_key = os.environ.get("CONTENT2SUBS_AUTHKEY")
+    if env_key:
+        return env_key.encode()
+    authkey = secrets.token_hex(32).encode()
+    key_file = _authkey_file()
+    key_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        os.fchmod(f.fileno(), 0o600)
+        f.write(authkey)
+    return authkey
+
+
+def _read_authkey() -> bytes:
+    """
+    Return $CONTENT2SUBS_AUTHKEY if set, else the key written by `serve`.
+    """
+    env_key = os.environ.get("CONTENT2SUBS_AUTHKEY")
+    if env_key:
+        return env_key.encode()
+    return _authkey_file().read_bytes()
+
+
+def _serve_worker(
+    model_name: str, compute_type: str, backend: str, job_queue, ready
+) -> None:
+    """
+    Worker loop of the `serve` daemon: load the model once, report on `ready`
+    (None on success, the error message otherwise), then process
+    `{media_paths, output_dir, srt_only}` jobs until the process is killed.
+    Each job runs as one pipeline, so its files overlap decode and transcription.
+    Exits once the daemon process is gone.
+    """
+    try:
+        model = _STATE.get_model(model_name, compute_type, backend)
+    except Exception as exc:
+        ready.put(f"{type(exc).__name__}: {exc}")
+        raise
+    ready.put(None)
+    daemon = multiprocessing.parent_process()
+    while True:
+        try:
+            job = job_queue.get(timeout=1)
+        except queue.Empty:
+            # Don't outlive a daemon killed by a signal, holding the model
+            if daemon is not None and not daemon.is_alive():
+                return
+            continue
+        try:
+            generate_subtitles(
+                media_paths=job["media_paths"],
+                model=model,
+                srt_only=job["srt_only"],
+                output_dir=job["output_dir"],
+            )
+        except Exception:
+            logger.exception(
+                "Failed to subtitle %d file(s) in '%s'",
+                len(job["media_paths"]),
+                job["output_dir"],
+            )
+
+
+def _wait_until_ready(worker: multiprocessing.Process, ready) -> Optional[str]:
+    """
+    Block until `worker` has loaded its model. Returns None on success or a
+    description of why it failed (including the worker dying silently, e.g. OOM).
+    """
+    while True:
+        try:
+            return ready.get(timeout=1)
+        except queue.Empty:
+            if not worker.is_alive():
+                return f"worker exited with code {worker.exitcode}"
+
+
+def serve(model_name: str, compute_type: str, backend: str, address: str) -> None:
+    """
+    Run the long-lived daemon: a worker process keeps `model_name` resident
+    and consumes jobs that client invocations submit to `address`.
+    Jobs are only accepted once the model has loaded, and the daemon stops
+    as soon as the worker dies.
+
+    Without $CONTENT2SUBS_AUTHKEY a random key is written to `_authkey_file()`;
+    non-loopback addresses require the key to be set explicitly, since anyone
+    holding it can run code as the daemon user.
+    """
+    host, port = _parse_address(address)
+    if not _is_loopback(host) and not os.environ.get("CONTENT2SUBS_AUTHKEY"):
+        logger.error(
+            "Refusing to serve on non-loopback address '%s' without "
+            "CONTENT2SUBS_AUTHKEY set.",
+            address,
+        )
+        return
+    authkey = _create_authkey()
+
+    job_queue = multiprocessing.Queue()
+    ready = multiprocessing.Queue()
+    worker = multiprocessing.Process(
+        target=_serve_worker,
+        args=(model_name, compute_type, backend, job_queue, ready),
+        daemon=True,
+    )
+    worker.start()
+    error = _wait_until_ready(worker, ready)
+    if error is not None:
+        raise RuntimeError(f"Failed to load model '{model_name}': {error}")
+
+    _JobManager.register("get_job_queue", callable=lambda: job_queue)
+    manager = _JobManager(address=(host, port), authkey=authkey)
+    server = manager.get_server()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    logger.info("Serving model '%s' on %s", model_name, address)
+
+    worker.join()
+    raise RuntimeError(f"Serve worker exited with code {worker.exitcode}")
+
+
+def submit_jobs(
+    media_paths: List[Path], srt_only: bool, output_dir: Path, address: str
+) -> None:
+    """
+    Hand `media_paths` to a running `serve` daemon at `address`, as a single
+    job, instead of loading the model in this process.
+    """
+    try:
+        authkey = _read_authkey()
+    except FileNotFoundError:
+        logger.error(
+            "No server key: set CONTENT2SUBS_AUTHKEY or start 'serve' as this user."
+        )
+        return
+    _JobManager.register("get_job_queue")
+    manager = _JobManager(address=_parse_address(address), authkey=authkey)
+    try:
+        manager.connect()
+    except ConnectionRefusedError:
+        logger.error("No server is listening at %s; start it with 'serve'.", address)
+        return
+    except multiprocessing.AuthenticationError:
+        logger.error(
+            "Server at %s rejected the key: CONTENT2SUBS_AUTHKEY (or the key file "
+            "written by 'serve') does not match the running server.",
+            address,
+        )
+        return
+    job_queue = manager.get_job_queue()
+    job_queue.put(
+        {"media_paths": media_paths, "output_dir": output_dir, "srt_only": srt_only}
+    )
+    logger.info("Submitted %d file(s) to server at %s", len(media_paths), address)
+
+
 def parse_arguments() -> argparse.Namespace:
     """
     Returns parsed command-line arguments.
@@ -156,6 +960,13 @@ def parse_arguments() -> argparse.Namespace:
         description="Automatically generate (and optionally burn) subtitles for audio/video files."
     )
 
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["run", "serve"],
+        default="run",
+        help="'run' (default) subtitles the files in --root; 'serve' starts a daemon that keeps the model loaded.",
+    )
     parser.add_argument(
         "--root",
         type=str,
@@ -168,12 +979,46 @@ def parse_arguments() -> argparse.Namespace:
         default="small",
         help="Which Whisper model to use (e.g. tiny, small, medium, medium.en, large).",
     )
+    parser.add_argument(
+        "--backend",
+        choices=["faster_whisper", "whisper_cpp"],
+        default="faster_whisper",
+        help="Transcription backend. 'whisper_cpp' runs quantized GGML models through "
+        "the whisper.cpp CLI (whisper-cli), which is faster on CPU-only hosts; "
+        "--model is then a GGML file or a name found under $WHISPER_CACHE.",
+    )
+    parser.add_argument(
+        "--compute_type",
+        type=str,
+        default="auto",
+        help="CTranslate2 compute type (e.g. float16, int8_float16, int8). "
+        "'auto' uses int8_float16 on GPU and int8 on CPU.",
+    )
     parser.add_argument(
         "--srt_only",
         type=lambda x: x.lower() == "true",
         default=True,
         help="If 'true', only generate .srt files. If 'false', also burn them into new .mp4 for videos.",
     )
+    parser.add_argument(
+        "--max_workers",
+        type=int,
+        default=None,
+        help=(
+            "Maximum number of concurrent ffmpeg processes per stage (default: "
+            "number of CPUs). Audio extraction never runs more than "
+            f"{PIPELINE_QUEUE_SIZE + 1} files at a time (plus one per extra GPU), "
+            "which bounds the decoded audio held in memory; burn-in is also "
+            "capped by CPU cores and NVENC sessions."
+        ),
+    )
+    parser.add_argument(
+        "--server",
+        type=str,
+        default=None,
+        help=f"Address (host:port) of a running 'serve' daemon to submit jobs to. "
+        f"With 'serve', the address to listen on (default {DEFAULT_SERVER_ADDRESS}).",
+    )
 
     return parser.parse_args()
 
@@ -188,6 +1033,15 @@ def main():
     model_name = args.model
     srt_only = args.srt_only
 
+    if args.command == "serve":
+        serve(
+            model_name,
+            args.compute_type,
+            args.backend,
+            args.server or DEFAULT_SERVER_ADDRESS,
+        )
+        return
+
     # Collect all files with SUPPORTED_EXTENSIONS in root_path
     if not root_path.is_dir():
         logger.error(
@@ -195,9 +1049,19 @@ def main():
         )
         return
 
+    # One directory scan collects both the media files and the existing .srt stems
+    supported = set(SUPPORTED_EXTENSIONS)
     all_files = []
-    for ext in SUPPORTED_EXTENSIONS:
-        all_files.extend(root_path.glob(f"*{ext}"))
+    existing_srts = set()
+    with os.scandir(root_path) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            path = Path(entry.path)
+            if path.suffix in supported:
+                all_files.append(path)
+            elif path.suffix == ".srt":
+                existing_srts.add(path.stem)
 
     if not all_files:
         logger.info(
@@ -213,12 +1077,12 @@ def main():
     logger.info("Checking for existing .srt files...")
     to_subtitle = []
     for media_file in tqdm(all_files, desc="Scanning files"):
-        srt_candidate = root_path / f"{strip_extension(media_file)}.srt"
-        if srt_candidate.exists():
+        stem = media_file.stem
+        if stem in existing_srts:
             logger.info(
-                "Skipping '%s': subtitle '%s' already exists.",
+                "Skipping '%s': subtitle '%s.srt' already exists.",
                 media_file.name,
-                srt_candidate.name,
+                stem,
             )
         else:
             to_subtitle.append(media_file)
@@ -227,17 +1091,23 @@ def main():
         logger.info("No new files require subtitles.")
         return
 
+    if args.server:
+        submit_jobs(to_subtitle, srt_only, root_path, args.server)
+        return
+
     # Generate subtitles + optionally burn
     logger.info("Generating subtitles for %d file(s)...", len(to_subtitle))
     generate_subtitles(
         media_paths=to_subtitle,
-        model_name=model_name,
+        model=_STATE.get_model(model_name, args.compute_type, args.backend),
         srt_only=srt_only,
         output_dir=root_path,
+        max_workers=args.max_workers,
     )
 
     logger.info("All done!")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
     main()
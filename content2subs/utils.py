@@ -1,10 +1,10 @@
 from pathlib import Path
 import logging
 
-from content2subs.constants import VIDEO_EXTENSIONS
+from content2subs.constants import BOILERPLATE_PHRASES, VIDEO_EXTENSIONS
 LOGGER = logging.getLogger(__name__)
 
-def format_timestamp(seconds: float, always_include_hours: bool = False) -> str:
+def format_timestamp(seconds: float) -> str:
     """
     Convert `seconds` to an SRT timestamp string, e.g. "00:00:03,210".
     """
@@ -12,33 +12,68 @@ def format_timestamp(seconds: float, always_include_hours: bool = False) -> str:
         raise ValueError("Timestamp must be non-negative")
 
     milliseconds = round(seconds * 1000)
-    hours = milliseconds // 3_600_000
-    milliseconds -= hours * 3_600_000
+    hours, milliseconds = divmod(milliseconds, 3_600_000)
+    minutes, milliseconds = divmod(milliseconds, 60_000)
+    secs, milliseconds = divmod(milliseconds, 1_000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
 
-    minutes = milliseconds // 60_000
-    milliseconds -= minutes * 60_000
 
-    secs = milliseconds // 1_000
-    milliseconds -= secs * 1_000
+def _is_ngram_loop(text: str, n: int = 3, min_repeats: int = 4) -> bool:
+    """
+    Return True if `text` contains Whisper's looping failure mode: an `n`-word
+    sequence repeated back-to-back `min_repeats` times. Shorter sequences count
+    when their repetition covers the same number of words (e.g. a bigram x6).
+    """
+    tokens = text.lower().split()
+    span = n * min_repeats
+    for size in range(1, n + 1):
+        repeats = -(-span // size)  # ceil division
+        for start in range(len(tokens) - size * repeats + 1):
+            gram = tokens[start : start + size]
+            if all(
+                tokens[start + k * size : start + (k + 1) * size] == gram
+                for k in range(1, repeats)
+            ):
+                return True
+    return False
+
 
-    hours_marker = f"{hours:02d}:" if (always_include_hours or hours > 0) else ""
-    return f"{hours_marker}{minutes:02d}:{secs:02d},{milliseconds:03d}"
+def _is_boilerplate(text: str) -> bool:
+    """
+    Return True if `text` is one of the stock phrases Whisper hallucinates
+    (e.g. "Thanks for watching!").
+    """
+    return text.lower().strip(" .!?,") in BOILERPLATE_PHRASES
 
 
 def write_srt(transcript_segments, srt_file: Path):
     """
     Given a list of Whisper transcript segments (with start, end, text),
     write them to `srt_file` in standard SRT format.
+    Looping and boilerplate segments are dropped and the rest renumbered.
+    The whole body is built in memory and written with a single call.
     """
     LOGGER.info("Writing SRT to %s", srt_file)
-    with srt_file.open("w", encoding="utf-8") as f:
-        for i, segment in enumerate(transcript_segments, start=1):
-            start_ts = format_timestamp(segment["start"], always_include_hours=True)
-            end_ts = format_timestamp(segment["end"], always_include_hours=True)
-            # Avoid messing up SRT arrow with text that contains "-->"
-            text = segment["text"].strip().replace("-->", "->")
+    kept = []
+    for segment in transcript_segments:
+        text = segment["text"].strip()
+        if _is_ngram_loop(text) or _is_boilerplate(text):
+            LOGGER.debug("Dropping hallucinated segment: %r", text)
+            continue
+        kept.append((segment["start"], segment["end"], text))
+
+    parts = []
+    append = parts.append
+    for i, (start, end, text) in enumerate(kept, start=1):
+        start_ts = format_timestamp(start)
+        end_ts = format_timestamp(end)
+        # Avoid messing up SRT arrow with text that contains "-->"
+        text = text.replace("-->", "->")
 
-            f.write(f"{i}\n{start_ts} --> {end_ts}\n{text}\n\n")
+        append(f"{i}\n{start_ts} --> {end_ts}\n{text}\n\n")
+
+    with srt_file.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write("".join(parts))
 
 
 def is_video_file(path: Path) -> bool:
@@ -47,10 +82,3 @@ def is_video_file(path: Path) -> bool:
     (used to decide if we can burn subtitles).
     """
     return path.suffix.lower() in VIDEO_EXTENSIONS
-
-
-def strip_extension(filename: Path) -> str:
-    """
-    Return the stem (basename without extension) of `filename`.
-    """
-    return filename.stem
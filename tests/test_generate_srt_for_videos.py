@@ -0,0 +1,153 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import ffmpeg
+
+from content2subs import generate_srt_for_videos as gsv
+
+
+def _probe_result(*codecs):
+    return {"streams": [{"codec_type": "audio", "codec_name": c} for c in codecs]}
+
+
+class AudioCodecTest(unittest.TestCase):
+    def audio_codec(self, **probe):
+        with mock.patch("ffmpeg.probe", **probe) as fake_probe:
+            codec = gsv._audio_codec(Path("in.mkv"))
+        fake_probe.assert_called_once_with("in.mkv", select_streams="a:0")
+        return codec
+
+    def test_copies_mp4_compatible_codecs(self):
+        for name in ("aac", "mp3", "ac3", "opus", "alac"):
+            with self.subTest(name=name):
+                self.assertEqual(
+                    self.audio_codec(return_value=_probe_result(name)), "copy"
+                )
+
+    def test_reencodes_other_codecs(self):
+        for name in ("pcm_s16le", "vorbis", "truehd"):
+            with self.subTest(name=name):
+                self.assertEqual(
+                    self.audio_codec(return_value=_probe_result(name)), "aac"
+                )
+
+    def test_no_audio_stream(self):
+        self.assertEqual(self.audio_codec(return_value=_probe_result()), "aac")
+
+    def test_probe_failure_reencodes(self):
+        error = ffmpeg.Error("ffprobe", b"", b"Invalid data")
+        with self.assertLogs(gsv.logger, level="WARNING"):
+            self.assertEqual(self.audio_codec(side_effect=error), "aac")
+
+
+class BurnSubtitlesIntoVideoTest(unittest.TestCase):
+    @mock.patch("subprocess.run")
+    @mock.patch.object(gsv, "_audio_codec", return_value="copy")
+    @mock.patch.object(gsv, "_video_encoder", return_value=("libx264", "veryfast"))
+    def burn_command(self, _video_encoder, _audio_codec, run):
+        run.return_value.returncode = 0
+        output = gsv.burn_subtitles_into_video(
+            Path("in.mkv"), Path("in.srt"), Path("out")
+        )
+        self.assertEqual(output, Path("out/in_subtitled.mp4"))
+        return run.call_args.args[0]
+
+    def test_maps_only_the_probed_audio_track(self):
+        cmd = self.burn_command()
+        maps = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-map"]
+        self.assertIn("0:a:0?", maps)
+        self.assertNotIn("0:a", maps)
+        self.assertEqual(cmd[cmd.index("-acodec") + 1], "copy")
+
+
+class ExtractWavTest(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_root = Path(tmp_dir.name)
+
+    @mock.patch.object(gsv, "_run_ffmpeg")
+    def test_same_stem_gets_distinct_wavs(self, _run_ffmpeg):
+        _, mp4_wav = gsv._extract_wav(Path("x.mp4"), self.tmp_root)
+        _, mkv_wav = gsv._extract_wav(Path("x.mkv"), self.tmp_root)
+        self.assertNotEqual(mp4_wav, mkv_wav)
+        for wav_path in (mp4_wav, mkv_wav):
+            self.assertEqual(wav_path.parent, self.tmp_root)
+            self.assertEqual(wav_path.suffix, ".wav")
+            self.assertTrue(wav_path.name.startswith("x-"))
+
+    @mock.patch.object(gsv, "_run_ffmpeg", side_effect=OSError("ffmpeg missing"))
+    def test_failure_removes_the_wav(self, _run_ffmpeg):
+        with self.assertRaises(OSError):
+            gsv._extract_wav(Path("x.mp4"), self.tmp_root)
+        self.assertEqual(list(self.tmp_root.iterdir()), [])
+
+
+def _segment(compression_ratio=1.5, no_speech_prob=0.1, avg_logprob=-0.3):
+    return mock.Mock(
+        compression_ratio=compression_ratio,
+        no_speech_prob=no_speech_prob,
+        avg_logprob=avg_logprob,
+    )
+
+
+class IsReliableTest(unittest.TestCase):
+    def test_typical_speech(self):
+        self.assertTrue(gsv._is_reliable(_segment()))
+
+    def test_repetitive_segment(self):
+        self.assertFalse(gsv._is_reliable(_segment(compression_ratio=2.5)))
+
+    def test_silent_low_confidence_segment(self):
+        self.assertFalse(
+            gsv._is_reliable(_segment(no_speech_prob=0.8, avg_logprob=-1.2))
+        )
+
+    def test_silence_guard_needs_both_scores(self):
+        self.assertTrue(gsv._is_reliable(_segment(no_speech_prob=0.8)))
+        self.assertTrue(gsv._is_reliable(_segment(avg_logprob=-1.2)))
+
+
+class MainDiscoveryTest(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.root = Path(tmp_dir.name).resolve()
+
+    def run_main(self, *names):
+        for name in names:
+            path = self.root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+        argv = ["generate_srt_for_videos", "--root", str(self.root)]
+        with (
+            mock.patch("sys.argv", argv),
+            mock.patch.object(gsv, "generate_subtitles") as generate,
+            mock.patch.object(gsv._STATE, "get_model"),
+        ):
+            gsv.main()
+        return generate
+
+    def test_skips_files_with_existing_srt(self):
+        generate = self.run_main("a.mp4", "a.srt", "c.mkv", "b.mp3")
+        self.assertEqual(
+            generate.call_args.kwargs["media_paths"],
+            [self.root / "b.mp3", self.root / "c.mkv"],
+        )
+        self.assertEqual(generate.call_args.kwargs["output_dir"], self.root)
+
+    def test_ignores_unsupported_files_and_subdirectories(self):
+        generate = self.run_main("notes.txt", "sub/d.mp4", "sub.mp4/e.srt", "e.wav")
+        self.assertEqual(
+            generate.call_args.kwargs["media_paths"], [self.root / "e.wav"]
+        )
+
+    def test_nothing_left_to_subtitle(self):
+        generate = self.run_main("a.mp4", "a.srt")
+        generate.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from content2subs.utils import (
+    _is_boilerplate,
+    _is_ngram_loop,
+    format_timestamp,
+    write_srt,
+)
+
+
+class FormatTimestampTest(unittest.TestCase):
+    def test_zero(self):
+        self.assertEqual(format_timestamp(0), "00:00:00,000")
+
+    def test_components(self):
+        self.assertEqual(format_timestamp(3723.21), "01:02:03,210")
+
+    def test_rounds_to_milliseconds(self):
+        self.assertEqual(format_timestamp(1.9996), "00:00:02,000")
+
+    def test_hours_past_99(self):
+        self.assertEqual(format_timestamp(360_000), "100:00:00,000")
+
+    def test_negative_raises(self):
+        with self.assertRaises(ValueError):
+            format_timestamp(-0.5)
+
+
+class IsNgramLoopTest(unittest.TestCase):
+    def test_repeated_trigram(self):
+        self.assertTrue(_is_ngram_loop("I am here " * 4))
+
+    def test_repeated_trigram_too_few_times(self):
+        self.assertFalse(_is_ngram_loop("I am here " * 3))
+
+    def test_repeated_bigram_covering_same_span(self):
+        self.assertTrue(_is_ngram_loop("go on " * 6))
+        self.assertFalse(_is_ngram_loop("go on " * 5))
+
+    def test_repeated_word(self):
+        self.assertTrue(_is_ngram_loop("no " * 12))
+
+    def test_loop_inside_sentence(self):
+        self.assertTrue(_is_ngram_loop("and then " + "la la la " * 4 + "he left"))
+
+    def test_case_insensitive(self):
+        self.assertTrue(_is_ngram_loop("Yes yes YES " * 4))
+
+    def test_normal_sentence(self):
+        self.assertFalse(
+            _is_ngram_loop("The quick brown fox jumps over the lazy dog again")
+        )
+
+    def test_empty(self):
+        self.assertFalse(_is_ngram_loop(""))
+
+
+class IsBoilerplateTest(unittest.TestCase):
+    def test_known_phrase(self):
+        self.assertTrue(_is_boilerplate("Thanks for watching!"))
+
+    def test_ignores_case_and_punctuation(self):
+        self.assertTrue(_is_boilerplate("  PLEASE LIKE AND SUBSCRIBE... "))
+
+    def test_phrase_within_speech(self):
+        self.assertFalse(_is_boilerplate("Thanks for watching the match with us"))
+
+    def test_regular_text(self):
+        self.assertFalse(_is_boilerplate("Hello there"))
+
+
+class WriteSrtTest(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.srt_file = Path(tmp_dir.name) / "out.srt"
+
+    def test_drops_hallucinations_and_renumbers(self):
+        write_srt(
+            [
+                {"start": 0.0, "end": 1.5, "text": " Hello there."},
+                {"start": 1.5, "end": 3.0, "text": " Thanks for watching!"},
+                {"start": 3.0, "end": 4.0, "text": " la la la" * 4},
+                {"start": 4.0, "end": 5.25, "text": " Goodbye."},
+            ],
+            self.srt_file,
+        )
+        self.assertEqual(
+            self.srt_file.read_text(encoding="utf-8"),
+            "1\n00:00:00,000 --> 00:00:01,500\nHello there.\n\n"
+            "2\n00:00:04,000 --> 00:00:05,250\nGoodbye.\n\n",
+        )
+
+    def test_escapes_srt_arrow(self):
+        write_srt([{"start": 0, "end": 1, "text": "a --> b"}], self.srt_file)
+        self.assertIn("\na -> b\n", self.srt_file.read_text(encoding="utf-8"))
+
+    def test_no_segments(self):
+        write_srt([], self.srt_file)
+        self.assertEqual(self.srt_file.read_text(encoding="utf-8"), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
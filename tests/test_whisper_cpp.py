@@ -0,0 +1,123 @@
+import json
+import os
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from content2subs.generate_srt_for_videos import (
+    WhisperCppModel,
+    _load_whisper_cpp_model,
+)
+
+
+def _fake_whisper_cli(transcription, returncode=0, stderr=b""):
+    """
+    Stand-in for `subprocess.run` that writes whisper-cli's `-oj` output.
+    """
+
+    def run(cmd, **kwargs):
+        json_path = Path(cmd[cmd.index("-of") + 1] + ".json")
+        if returncode == 0:
+            json_path.write_text(json.dumps({"transcription": transcription}))
+        return subprocess.CompletedProcess(cmd, returncode, stderr=stderr)
+
+    return run
+
+
+class WhisperCppModelTranscribeTest(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.wav_path = Path(tmp_dir.name) / "clip.wav"
+        self.model = WhisperCppModel(Path("ggml-tiny.bin"), language="en", threads=2)
+
+    def test_maps_offsets_to_seconds(self):
+        transcription = [
+            {"offsets": {"from": 0, "to": 1500}, "text": " Hello."},
+            {"offsets": {"from": 1500, "to": 62250}, "text": " World."},
+        ]
+        with mock.patch("subprocess.run", _fake_whisper_cli(transcription)):
+            segments = self.model.transcribe(self.wav_path)
+        self.assertEqual(
+            segments,
+            [
+                {"start": 0.0, "end": 1.5, "text": " Hello."},
+                {"start": 1.5, "end": 62.25, "text": " World."},
+            ],
+        )
+        self.assertFalse(self.wav_path.with_suffix(".json").exists())
+
+    def test_passes_model_language_and_threads(self):
+        run = mock.Mock(side_effect=_fake_whisper_cli([]))
+        with mock.patch("subprocess.run", run):
+            self.assertEqual(self.model.transcribe(self.wav_path), [])
+        cmd = run.call_args.args[0]
+        self.assertEqual(cmd[cmd.index("-m") + 1], "ggml-tiny.bin")
+        self.assertEqual(cmd[cmd.index("-f") + 1], str(self.wav_path))
+        self.assertEqual(cmd[cmd.index("-l") + 1], "en")
+        self.assertEqual(cmd[cmd.index("-t") + 1], "2")
+
+    def test_failure_raises_with_stderr(self):
+        fake = _fake_whisper_cli([], returncode=1, stderr=b"failed to load model\n")
+        with mock.patch("subprocess.run", fake), self.assertLogs(level="ERROR"):
+            with self.assertRaises(subprocess.CalledProcessError) as ctx:
+                self.model.transcribe(self.wav_path)
+        self.assertEqual(ctx.exception.stderr, "failed to load model")
+
+
+class LoadWhisperCppModelTest(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.model_dir = Path(tmp_dir.name)
+        patcher = mock.patch.dict(os.environ, {"WHISPER_CACHE": tmp_dir.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def add_models(self, *names):
+        for name in names:
+            (self.model_dir / name).touch()
+
+    def resolve(self, model_name, avx512=False):
+        with mock.patch(
+            "content2subs.generate_srt_for_videos._has_avx512", return_value=avx512
+        ):
+            return _load_whisper_cpp_model(model_name).model_path.name
+
+    def test_prefers_5bit_without_avx512(self):
+        self.add_models("ggml-small.bin", "ggml-small-q8_0.bin", "ggml-small-q5_1.bin")
+        self.assertEqual(self.resolve("small"), "ggml-small-q5_1.bin")
+
+    def test_prefers_q8_0_with_avx512(self):
+        self.add_models("ggml-small-q8_0.bin", "ggml-small-q5_1.bin")
+        self.assertEqual(self.resolve("small", avx512=True), "ggml-small-q8_0.bin")
+
+    def test_medium_q5_0(self):
+        self.add_models("ggml-medium.bin", "ggml-medium-q5_0.bin")
+        self.assertEqual(self.resolve("medium"), "ggml-medium-q5_0.bin")
+
+    def test_falls_back_to_unquantized(self):
+        self.add_models("ggml-base.bin")
+        self.assertEqual(self.resolve("base"), "ggml-base.bin")
+
+    def test_english_only_model(self):
+        self.add_models("ggml-small.en-q5_1.bin")
+        model = _load_whisper_cpp_model("small.en")
+        self.assertEqual(model.model_path.name, "ggml-small.en-q5_1.bin")
+        self.assertEqual(model.language, "en")
+
+    def test_explicit_path(self):
+        self.add_models("custom.bin")
+        model = _load_whisper_cpp_model(str(self.model_dir / "custom.bin"))
+        self.assertEqual(model.model_path, self.model_dir / "custom.bin")
+        self.assertEqual(model.language, "auto")
+
+    def test_missing_model(self):
+        with self.assertRaises(FileNotFoundError):
+            _load_whisper_cpp_model("small")
+
+
+if __name__ == "__main__":
+    unittest.main()